@@ -17,12 +17,15 @@ import { updateFormTemplate } from '../src/lib/formDefinitionRepository';
 import { FormTemplate, ConnectorConfig } from '../src/models/formTypes';
 import { PortalDefinition, FieldDefinition } from '../src/models/portalTypes';
 
+// Hoisted so each portal id derivation reuses the compiled pattern
+const WHITESPACE_PATTERN = /\s+/g;
+
 interface ConnectorSummary {
   portal: string;
   description?: string;
   fieldMap: Record<string, string>;
   transformations?: ConnectorConfig['transformations'];
-  templateIds: string[];
+  templateIds: Set<string>;
 }
 
 /**
@@ -39,24 +42,28 @@ async function extractConnectorConfigs(): Promise<Map<string, ConnectorSummary>>
     });
 
     for (const template of result.items) {
-      if (template.connectors) {
-        for (const connector of template.connectors) {
+      // Read the invariant template fields once rather than through the
+      // template object on every connector iteration; renamed so the
+      // binding does not shadow the accumulator map above
+      const { connectors: templateConnectors, templateId } = template;
+      if (templateConnectors) {
+        for (const connector of templateConnectors) {
           const key = connector.portal.toLowerCase();
-          
-          if (!connectors.has(key)) {
-            connectors.set(key, {
+
+          // Single map probe instead of has() followed by get()
+          let summary = connectors.get(key);
+          if (!summary) {
+            summary = {
               portal: connector.portal,
               description: connector.description,
               fieldMap: connector.fieldMap || {},
               transformations: connector.transformations,
-              templateIds: []
-            });
-          }
-
-          const summary = connectors.get(key)!;
-          if (!summary.templateIds.includes(template.templateId)) {
-            summary.templateIds.push(template.templateId);
+              templateIds: new Set<string>()
+            };
+            connectors.set(key, summary);
           }
+          // Set.add deduplicates in one probe instead of a linear scan
+          summary.templateIds.add(templateId);
         }
       }
     }
@@ -81,8 +88,7 @@ function convertTransformations(
 
   for (const [targetField, config] of Object.entries(transformations)) {
     if (config.type === 'concat') {
-      const fields = config.fields.map(f => f).join(' & " " & ');
-      jsonataExpressions[targetField] = fields;
+      jsonataExpressions[targetField] = config.fields.join(' & " " & ');
     }
   }
 
@@ -95,22 +101,24 @@ function convertTransformations(
 function createPortalDefinition(
   summary: ConnectorSummary
 ): Omit<PortalDefinition, 'createdAt' | 'updatedAt'> {
-  const portalId = summary.portal.toLowerCase().replace(/\s+/g, '-');
+  const portalId = summary.portal.toLowerCase().replace(WHITESPACE_PATTERN, '-');
   
-  // Build field definitions from field map
+  // Build field definitions, default mappings, and the target-to-source
+  // index in a single sweep over the field map instead of iterating it once
+  // per structure plus once per transformation
   const fieldDefinitions: Record<string, FieldDefinition> = {};
-  for (const targetField of Object.values(summary.fieldMap)) {
+  const defaultMappings: PortalDefinition['defaultMappings'] = {};
+  const sourceByTarget: Record<string, string> = {};
+  for (const [sourceField, targetField] of Object.entries(summary.fieldMap)) {
     if (!fieldDefinitions[targetField]) {
       fieldDefinitions[targetField] = {
         type: 'string', // Default type
         required: false
       };
     }
-  }
-
-  // Build default mappings
-  const defaultMappings: PortalDefinition['defaultMappings'] = {};
-  for (const [sourceField, targetField] of Object.entries(summary.fieldMap)) {
+    if (sourceByTarget[targetField] === undefined) {
+      sourceByTarget[targetField] = sourceField;
+    }
     defaultMappings[sourceField] = {
       targetField
     };
@@ -119,10 +127,7 @@ function createPortalDefinition(
   // Add transformations
   const transformationExpressions = convertTransformations(summary.transformations);
   for (const [targetField, expression] of Object.entries(transformationExpressions)) {
-    // Find source field that maps to this target
-    const sourceField = Object.entries(summary.fieldMap).find(
-      ([_, tf]) => tf === targetField
-    )?.[0];
+    const sourceField = sourceByTarget[targetField];
 
     if (sourceField) {
       defaultMappings[sourceField] = {
@@ -176,7 +181,7 @@ async function migrateConnectorConfigs(dryRun: boolean = true): Promise<void> {
         console.log(`[DRY RUN] Would create portal: ${portalDef.portalId}`);
         console.log(`  Name: ${portalDef.name}`);
         console.log(`  Mappings: ${Object.keys(portalDef.defaultMappings).length}`);
-        console.log(`  Used in ${summary.templateIds.length} templates`);
+        console.log(`  Used in ${summary.templateIds.size} templates`);
         results.created++;
       } else {
         await createPortal(portalDef);
@@ -201,7 +206,7 @@ async function migrateConnectorConfigs(dryRun: boolean = true): Promise<void> {
 
 // Run migration if executed directly
 if (require.main === module) {
-  const dryRun = process.argv.includes('--live') ? false : true;
+  const dryRun = !process.argv.includes('--live');
   migrateConnectorConfigs(dryRun)
     .then(() => {
       console.log('Migration completed');
@@ -7,6 +7,7 @@ import {
   getFormTemplate,
   listFormTemplates
 } from '../../lib/formDefinitionRepository';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 interface RenewalInitiatedEventData {
   templateId?: string;
@@ -18,7 +19,11 @@ interface RenewalInitiatedEventData {
 
 const handleRenewalInitiated: EventGridHandler = async (event, context) => {
   const data = event.data as unknown as RenewalInitiatedEventData;
-  context.log('RenewalInitiatedEvent received', data);
+  // The event payload carries the full policyData blob; only serialize it
+  // into the log when verbose logging is on
+  if (verboseLoggingEnabled) {
+    context.log('RenewalInitiatedEvent received', data);
+  }
 
   let template =
     (data.templateId &&
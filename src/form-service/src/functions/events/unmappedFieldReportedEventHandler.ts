@@ -2,6 +2,7 @@ import { app, EventGridHandler } from '@azure/functions';
 import { findOrCreateUnmappedField } from '../../lib/unmappedFieldRepository';
 import { getPortal } from '../../lib/portalRepository';
 import { suggestMappings } from '../../lib/fieldMatcher';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 interface UnmappedFieldReportedEvent {
   portalId: string;
@@ -11,48 +12,41 @@ interface UnmappedFieldReportedEvent {
 
 const handleUnmappedFieldReported: EventGridHandler = async (event, context) => {
   const eventGridEvent = event.data as unknown as UnmappedFieldReportedEvent;
+  // Read the event fields once instead of re-walking the attribute chain
+  const { portalId, fieldName, formDataFields } = eventGridEvent;
   try {
-    context.log('Processing unmapped field report', {
-      portalId: eventGridEvent.portalId,
-      fieldName: eventGridEvent.fieldName
-    });
+    if (verboseLoggingEnabled) {
+      context.log('Processing unmapped field report', { portalId, fieldName });
+    }
 
-    if (!eventGridEvent.portalId || !eventGridEvent.fieldName) {
+    if (!portalId || !fieldName) {
       context.warn('Invalid unmapped field event', eventGridEvent);
       return;
     }
 
     // Verify portal exists
-    const portal = await getPortal(eventGridEvent.portalId);
+    const portal = await getPortal(portalId);
     if (!portal || portal.isDeleted) {
-      context.warn('Portal not found or deleted', {
-        portalId: eventGridEvent.portalId
-      });
+      context.warn('Portal not found or deleted', { portalId });
       return;
     }
 
     // Generate suggestions if source fields provided
     let suggestions: Array<{ sourceField: string; confidence: number }> = [];
-    if (eventGridEvent.formDataFields && eventGridEvent.formDataFields.length > 0) {
-      suggestions = suggestMappings(
-        eventGridEvent.fieldName,
-        eventGridEvent.formDataFields,
-        3
-      );
+    if (formDataFields && formDataFields.length > 0) {
+      suggestions = suggestMappings(fieldName, formDataFields, 3);
     }
 
     // Find or create unmapped field record
-    await findOrCreateUnmappedField(
-      eventGridEvent.portalId,
-      eventGridEvent.fieldName,
-      suggestions
-    );
+    await findOrCreateUnmappedField(portalId, fieldName, suggestions);
 
-    context.log('Unmapped field processed successfully', {
-      portalId: eventGridEvent.portalId,
-      fieldName: eventGridEvent.fieldName,
-      suggestionsCount: suggestions.length
-    });
+    if (verboseLoggingEnabled) {
+      context.log('Unmapped field processed successfully', {
+        portalId,
+        fieldName,
+        suggestionsCount: suggestions.length
+      });
+    }
   } catch (error) {
     context.error('Error processing unmapped field report', error);
     throw error;
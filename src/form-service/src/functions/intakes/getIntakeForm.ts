@@ -1,38 +1,30 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { getIntake } from '../../lib/intakeFormRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const getIntakeHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const intakeId = request.params.intakeId;
+  const intakeId = request.params.intakeId;
+  if (verboseLoggingEnabled) {
     context.log('Fetching intake', { intakeId });
-    if (!intakeId) {
-      return jsonResponse(400, { error: 'intakeId is required' });
-    }
-    const intake = await getIntake(intakeId);
-    if (!intake) {
-      return jsonResponse(404, { error: 'Intake not found' });
-    }
-    return jsonResponse(200, intake);
-  } catch (error) {
-    context.error('Error fetching intake', error);
-    return handleError(error);
   }
+  if (!intakeId) {
+    return jsonResponse(400, { error: 'intakeId is required' });
+  }
+  const intake = await getIntake(intakeId);
+  if (!intake) {
+    return jsonResponse(404, { error: 'Intake not found' });
+  }
+  return jsonResponse(200, intake);
 };
 
 app.http('GetIntakeForm', {
   methods: ['GET', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'intakes/{intakeId}',
-  handler: getIntakeHandler
+  handler: withHttpHandler('Error fetching intake', getIntakeHandler)
 });
-
@@ -1,64 +1,53 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { listIntakesByTemplate, listAllIntakes } from '../../lib/intakeFormRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { parsePageSize } from '../../lib/queryParams';
+import { withHttpHandler } from '../../lib/httpHandler';
 
 const listIntakes = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const templateId = request.query.get('templateId') ?? undefined;
-    const status = request.query.get('status') ?? undefined;
-    const insuranceLine = request.query.get('insuranceLine') ?? undefined;
-    const search = request.query.get('search') ?? undefined;
-    const continuationToken = request.query.get('continuationToken') ?? undefined;
-    const pageSize = request.query.get('pageSize');
-    const parsedPageSize = pageSize ? parseInt(pageSize, 10) : undefined;
-
-    let items: any[];
-    let nextToken: string | undefined;
-
-    if (templateId) {
-      // Use existing function for template-specific listing
-      const result = await listIntakesByTemplate(templateId, continuationToken);
-      items = result.resources ?? [];
-      nextToken = result.continuationToken;
-    } else {
-      // Use new function for listing all intakes with filters
-      const result = await listAllIntakes({
-        status,
-        insuranceLine,
-        search,
-        continuationToken,
-        pageSize: parsedPageSize
-      });
-      items = result.items;
-      nextToken = result.continuationToken;
-    }
-
-    context.log(`Returned ${items.length} intakes${nextToken ? ' with continuation token' : ''}`);
-
-    return jsonResponse(200, {
-      items,
-      total: items.length,
-      continuationToken: nextToken
+  const templateId = request.query.get('templateId') ?? undefined;
+  const status = request.query.get('status') ?? undefined;
+  const insuranceLine = request.query.get('insuranceLine') ?? undefined;
+  const search = request.query.get('search') ?? undefined;
+  const continuationToken = request.query.get('continuationToken') ?? undefined;
+  const parsedPageSize = parsePageSize(request.query.get('pageSize'));
+
+  let items: any[];
+  let nextToken: string | undefined;
+
+  if (templateId) {
+    // Use existing function for template-specific listing
+    const result = await listIntakesByTemplate(templateId, continuationToken);
+    items = result.resources ?? [];
+    nextToken = result.continuationToken;
+  } else {
+    // Use new function for listing all intakes with filters
+    const result = await listAllIntakes({
+      status,
+      insuranceLine,
+      search,
+      continuationToken,
+      pageSize: parsedPageSize
     });
-  } catch (error) {
-    context.error('Error listing intakes', error);
-    return handleError(error);
+    items = result.items;
+    nextToken = result.continuationToken;
   }
+
+  context.log(`Returned ${items.length} intakes${nextToken ? ' with continuation token' : ''}`);
+
+  return jsonResponse(200, {
+    items,
+    total: items.length,
+    continuationToken: nextToken
+  });
 };
 
 app.http('ListIntakes', {
   methods: ['GET', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'intakes-list',
-  handler: listIntakes
+  handler: withHttpHandler('Error listing intakes', listIntakes)
 });
-
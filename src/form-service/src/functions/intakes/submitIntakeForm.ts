@@ -1,17 +1,20 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import {
-  createDraftIntake,
+  buildDraftIntake,
   getIntake,
   upsertIntake
 } from '../../lib/intakeFormRepository';
 import { getFormTemplate } from '../../lib/formDefinitionRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
+import { jsonResponse } from '../../lib/httpResponses';
 import { validateFormIntake } from '../../lib/validation';
 import { normalizeFormDataForConnectors } from '../../lib/connectorMapper';
 import { FormIntake } from '../../models/formTypes';
-import { publishIntakeFormSubmittedEvent } from '../../lib/eventGridPublisher';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import {
+  isEventGridConfigured,
+  publishIntakeFormSubmittedEvent
+} from '../../lib/eventGridPublisher';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 type SubmitIntakePayload = Partial<FormIntake> & {
   templateId: string;
@@ -23,74 +26,72 @@ const submitIntake = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const body = (await request.json()) as SubmitIntakePayload;
+  const body = (await request.json()) as SubmitIntakePayload;
+  if (verboseLoggingEnabled) {
     context.log('Submitting intake form', {
       templateId: body.templateId,
       intakeId: body.intakeId
     });
-    const templateId = body.templateId;
-    if (!templateId || !body.insuranceLine) {
-      return jsonResponse(400, {
-        error: 'templateId and insuranceLine are required for submission'
-      });
-    }
-    const template = await getFormTemplate(templateId, body.insuranceLine);
-    if (!template) {
-      return jsonResponse(404, { error: 'Template not found' });
-    }
-
-    let intake: FormIntake | null = null;
-    if (body.intakeId) {
-      intake = await getIntake(body.intakeId);
-    }
-    if (!intake) {
-      intake = await createDraftIntake({
-        templateId: template.templateId,
-        insuranceLine: template.insuranceLine,
-        customerId: body.customerId,
-        status: 'draft',
-        formDataRaw: body.formDataRaw ?? {},
-        formDataNormalized: {},
-        isRenewal: body.isRenewal,
-        sourceEventId: body.sourceEventId
-      });
-    }
+  }
+  const templateId = body.templateId;
+  if (!templateId || !body.insuranceLine) {
+    return jsonResponse(400, {
+      error: 'templateId and insuranceLine are required for submission'
+    });
+  }
+  const template = await getFormTemplate(templateId, body.insuranceLine);
+  if (!template) {
+    return jsonResponse(404, { error: 'Template not found' });
+  }
 
-    const completed: FormIntake = {
-      ...intake,
-      ...body,
-      id: intake.intakeId,
-      intakeId: intake.intakeId,
+  let intake: FormIntake | null = null;
+  if (body.intakeId) {
+    intake = await getIntake(body.intakeId);
+  }
+  if (!intake) {
+    // The completed document below replaces the draft under the same id,
+    // so build it in memory rather than persisting a write that is never
+    // read back
+    intake = buildDraftIntake({
       templateId: template.templateId,
       insuranceLine: template.insuranceLine,
-      status: 'completed',
-      formDataRaw: body.formDataRaw ?? intake.formDataRaw ?? {}
-    };
+      customerId: body.customerId,
+      status: 'draft',
+      formDataRaw: body.formDataRaw ?? {},
+      formDataNormalized: {},
+      isRenewal: body.isRenewal,
+      sourceEventId: body.sourceEventId
+    });
+  }
+
+  const completed: FormIntake = {
+    ...intake,
+    ...body,
+    id: intake.intakeId,
+    intakeId: intake.intakeId,
+    templateId: template.templateId,
+    insuranceLine: template.insuranceLine,
+    status: 'completed',
+    formDataRaw: body.formDataRaw ?? intake.formDataRaw ?? {}
+  };
 
-    completed.formDataNormalized = await normalizeFormDataForConnectors(
-      template,
-      completed
-    );
+  // Templates without connectors normalize to an empty object, so skip the
+  // async call entirely in that case
+  completed.formDataNormalized = template.connectors?.length
+    ? await normalizeFormDataForConnectors(template, completed)
+    : {};
 
-    validateFormIntake(completed);
-    const saved = await upsertIntake(completed);
+  validateFormIntake(completed);
+  const saved = await upsertIntake(completed);
+  if (isEventGridConfigured()) {
     await publishIntakeFormSubmittedEvent(saved);
-    return jsonResponse(200, saved);
-  } catch (error) {
-    context.error('Error submitting intake', error);
-    return handleError(error);
   }
+  return jsonResponse(200, saved);
 };
 
 app.http('SubmitIntakeForm', {
   methods: ['POST', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'intakes',
-  handler: submitIntake
+  handler: withHttpHandler('Error submitting intake', submitIntake)
 });
-
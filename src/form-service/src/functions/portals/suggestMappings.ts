@@ -1,63 +1,53 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
-import { suggestMappings } from '../../lib/fieldMatcher';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { suggestMappingsForTargets } from '../../lib/fieldMatcher';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const suggestMappingsHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const portalId = request.params.portalId;
-    if (!portalId) {
-      return jsonResponse(400, { error: 'portalId is required' });
-    }
-
-    const body = (await request.json()) as {
-      targetFields: string[];
-      sourceFields: string[];
-      maxResults?: number;
-    };
-
-    if (!body.targetFields || !body.sourceFields) {
-      return jsonResponse(400, {
-        error: 'targetFields and sourceFields are required'
-      });
-    }
+  const portalId = request.params.portalId;
+  if (!portalId) {
+    return jsonResponse(400, { error: 'portalId is required' });
+  }
+
+  const body = (await request.json()) as {
+    targetFields: string[];
+    sourceFields: string[];
+    maxResults?: number;
+  };
+
+  // Read the payload fields once instead of re-walking body per use
+  const { targetFields, sourceFields, maxResults } = body;
+
+  if (!targetFields || !sourceFields) {
+    return jsonResponse(400, {
+      error: 'targetFields and sourceFields are required'
+    });
+  }
 
+  if (verboseLoggingEnabled) {
     context.log('Suggesting mappings', {
       portalId,
-      targetFieldsCount: body.targetFields.length,
-      sourceFieldsCount: body.sourceFields.length
+      targetFieldsCount: targetFields.length,
+      sourceFieldsCount: sourceFields.length
     });
-
-    const suggestions: Record<string, Array<{ sourceField: string; confidence: number }>> = {};
-
-    for (const targetField of body.targetFields) {
-      const fieldSuggestions = suggestMappings(
-        targetField,
-        body.sourceFields,
-        body.maxResults || 3
-      );
-      suggestions[targetField] = fieldSuggestions;
-    }
-
-    return jsonResponse(200, { suggestions });
-  } catch (error) {
-    context.error('Error suggesting mappings', error);
-    return handleError(error);
   }
+
+  const suggestions = suggestMappingsForTargets(
+    targetFields,
+    sourceFields,
+    maxResults || 3
+  );
+
+  return jsonResponse(200, { suggestions });
 };
 
 app.http('SuggestMappings', {
   methods: ['POST', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'portals/{portalId}/suggest-mappings',
-  handler: suggestMappingsHandler
+  handler: withHttpHandler('Error suggesting mappings', suggestMappingsHandler)
 });
-
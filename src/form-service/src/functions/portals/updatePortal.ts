@@ -1,50 +1,42 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { getPortal, updatePortal } from '../../lib/portalRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
+import { jsonResponse } from '../../lib/httpResponses';
 import { PortalDefinition } from '../../models/portalTypes';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const updatePortalHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const portalId = request.params.portalId;
-    if (!portalId) {
-      return jsonResponse(400, { error: 'portalId is required' });
-    }
+  const portalId = request.params.portalId;
+  if (!portalId) {
+    return jsonResponse(400, { error: 'portalId is required' });
+  }
 
-    const body = (await request.json()) as Partial<PortalDefinition>;
+  const body = (await request.json()) as Partial<PortalDefinition>;
+  if (verboseLoggingEnabled) {
     context.log('Updating portal', { portalId });
+  }
 
-    const existing = await getPortal(portalId);
-    if (!existing) {
-      return jsonResponse(404, { error: 'Portal not found' });
-    }
+  const existing = await getPortal(portalId);
+  if (!existing) {
+    return jsonResponse(404, { error: 'Portal not found' });
+  }
 
-    const updated: PortalDefinition = {
-      ...existing,
-      ...body,
-      portalId: existing.portalId // Don't allow changing portalId
-    };
+  const updated: PortalDefinition = {
+    ...existing,
+    ...body,
+    portalId: existing.portalId // Don't allow changing portalId
+  };
 
-    const result = await updatePortal(updated);
-    return jsonResponse(200, result);
-  } catch (error) {
-    context.error('Error updating portal', error);
-    return handleError(error);
-  }
+  const result = await updatePortal(updated);
+  return jsonResponse(200, result);
 };
 
 app.http('UpdatePortal', {
   methods: ['PUT', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'portals-update/{portalId}',
-  handler: updatePortalHandler
+  handler: withHttpHandler('Error updating portal', updatePortalHandler)
 });
-
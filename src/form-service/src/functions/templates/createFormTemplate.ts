@@ -1,10 +1,10 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { createFormTemplate } from '../../lib/formDefinitionRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
+import { jsonResponse } from '../../lib/httpResponses';
 import { validateFormTemplate } from '../../lib/validation';
 import { FormTemplate } from '../../models/formTypes';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 type TemplatePayload = Partial<FormTemplate>;
 
@@ -12,41 +12,33 @@ const createTemplate = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const body = (await request.json()) as TemplatePayload;
+  const body = (await request.json()) as TemplatePayload;
+  if (verboseLoggingEnabled) {
     context.log('Creating template', {
       name: body.name,
       insuranceLine: body.insuranceLine
     });
-    const templateCandidate = {
-      ...(body as TemplatePayload),
-      templateId: body.templateId ?? 'temp',
-      version: 1,
-      createdAt: new Date().toISOString()
-    };
-    const validated = validateFormTemplate(templateCandidate);
-    const { templateId: _t, version: _v, createdAt: _c, ...createPayload } =
-      validated;
-    const created = await createFormTemplate({
-      ...createPayload,
-      status: validated.status ?? 'draft'
-    });
-    context.log(`Created template ${created.templateId}`);
-    return jsonResponse(201, created);
-  } catch (error) {
-    context.error('Error creating template', error);
-    return handleError(error);
   }
+  const templateCandidate = {
+    ...(body as TemplatePayload),
+    templateId: body.templateId ?? 'temp',
+    version: 1,
+    createdAt: new Date().toISOString()
+  };
+  const validated = validateFormTemplate(templateCandidate);
+  const { templateId: _t, version: _v, createdAt: _c, ...createPayload } =
+    validated;
+  const created = await createFormTemplate({
+    ...createPayload,
+    status: validated.status ?? 'draft'
+  });
+  context.log(`Created template ${created.templateId}`);
+  return jsonResponse(201, created);
 };
 
 app.http('CreateFormTemplate', {
   methods: ['POST', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'templates',
-  handler: createTemplate
+  handler: withHttpHandler('Error creating template', createTemplate)
 });
-
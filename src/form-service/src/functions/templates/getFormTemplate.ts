@@ -1,41 +1,30 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { getFormTemplate } from '../../lib/formDefinitionRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
 
 const getTemplate = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const templateId = request.params.templateId;
-    const insuranceLine = request.query.get('insuranceLine');
-    if (!templateId || !insuranceLine) {
-      return jsonResponse(400, {
-        error: 'templateId and insuranceLine are required'
-      });
-    }
+  const templateId = request.params.templateId;
+  const insuranceLine = request.query.get('insuranceLine');
+  if (!templateId || !insuranceLine) {
+    return jsonResponse(400, {
+      error: 'templateId and insuranceLine are required'
+    });
+  }
 
-    const template = await getFormTemplate(templateId, insuranceLine);
-    if (!template) {
-      return jsonResponse(404, { error: 'Template not found' });
-    }
-    return jsonResponse(200, template);
-  } catch (error) {
-    context.error('Error fetching template', error);
-    return handleError(error);
+  const template = await getFormTemplate(templateId, insuranceLine);
+  if (!template) {
+    return jsonResponse(404, { error: 'Template not found' });
   }
+  return jsonResponse(200, template);
 };
 
 app.http('GetFormTemplate', {
   methods: ['GET', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'templates/{templateId}',
-  handler: getTemplate
+  handler: withHttpHandler('Error fetching template', getTemplate)
 });
-
@@ -1,39 +1,31 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { softDeleteFormTemplate } from '../../lib/formDefinitionRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const deleteTemplate = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const templateId = request.params.templateId;
-    const insuranceLine = request.query.get('insuranceLine');
-    const deletedBy = request.query.get('deletedBy') ?? 'system';
-    if (!templateId || !insuranceLine) {
-      return jsonResponse(400, {
-        error: 'templateId and insuranceLine are required'
-      });
-    }
+  const templateId = request.params.templateId;
+  const insuranceLine = request.query.get('insuranceLine');
+  const deletedBy = request.query.get('deletedBy') ?? 'system';
+  if (!templateId || !insuranceLine) {
+    return jsonResponse(400, {
+      error: 'templateId and insuranceLine are required'
+    });
+  }
+  if (verboseLoggingEnabled) {
     context.log('Soft delete template request', { templateId });
-    await softDeleteFormTemplate(templateId, insuranceLine, deletedBy);
-    return jsonResponse(204, null);
-  } catch (error) {
-    context.error('Error deleting template', error);
-    return handleError(error);
   }
+  await softDeleteFormTemplate(templateId, insuranceLine, deletedBy);
+  return jsonResponse(204, null);
 };
 
 app.http('SoftDeleteFormTemplate', {
   methods: ['DELETE', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'templates-delete/{templateId}',
-  handler: deleteTemplate
+  handler: withHttpHandler('Error deleting template', deleteTemplate)
 });
-
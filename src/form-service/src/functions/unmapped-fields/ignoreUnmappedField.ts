@@ -1,45 +1,37 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { ignoreUnmappedField } from '../../lib/unmappedFieldRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const ignoreUnmappedFieldHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const fieldId = request.params.fieldId;
-    if (!fieldId) {
-      return jsonResponse(400, { error: 'fieldId is required' });
-    }
+  const fieldId = request.params.fieldId;
+  if (!fieldId) {
+    return jsonResponse(400, { error: 'fieldId is required' });
+  }
 
-    const body = (await request.json()) as { portalId: string };
-    if (!body.portalId) {
-      return jsonResponse(400, { error: 'portalId is required' });
-    }
+  const body = (await request.json()) as { portalId: string };
+  if (!body.portalId) {
+    return jsonResponse(400, { error: 'portalId is required' });
+  }
 
-    // Get user from auth token (simplified)
-    const ignoredBy = 'system'; // TODO: Extract from auth token
+  // Get user from auth token (simplified)
+  const ignoredBy = 'system'; // TODO: Extract from auth token
 
+  if (verboseLoggingEnabled) {
     context.log('Ignoring unmapped field', { fieldId, portalId: body.portalId });
-
-    const ignored = await ignoreUnmappedField(fieldId, body.portalId, ignoredBy);
-    return jsonResponse(200, ignored);
-  } catch (error) {
-    context.error('Error ignoring unmapped field', error);
-    return handleError(error);
   }
+
+  const ignored = await ignoreUnmappedField(fieldId, body.portalId, ignoredBy);
+  return jsonResponse(200, ignored);
 };
 
 app.http('IgnoreUnmappedField', {
   methods: ['POST', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'unmapped-fields/{fieldId}/ignore',
-  handler: ignoreUnmappedFieldHandler
+  handler: withHttpHandler('Error ignoring unmapped field', ignoreUnmappedFieldHandler)
 });
-
@@ -1,46 +1,37 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
 import { listUnmappedFields } from '../../lib/unmappedFieldRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { jsonResponse } from '../../lib/httpResponses';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
+import { parsePageSize } from '../../lib/queryParams';
 import { UnmappedFieldStatus } from '../../models/portalTypes';
 
 const listUnmappedFieldsHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const portalId = request.query.get('portalId') || undefined;
-    const status = (request.query.get('status') as UnmappedFieldStatus) || undefined;
-    const continuationToken = request.query.get('continuationToken') || undefined;
-    const pageSize = request.query.get('pageSize')
-      ? parseInt(request.query.get('pageSize')!, 10)
-      : undefined;
+  const portalId = request.query.get('portalId') || undefined;
+  const status = (request.query.get('status') as UnmappedFieldStatus) || undefined;
+  const continuationToken = request.query.get('continuationToken') || undefined;
+  const pageSize = parsePageSize(request.query.get('pageSize'));
 
+  if (verboseLoggingEnabled) {
     context.log('Listing unmapped fields', { portalId, status, pageSize });
+  }
 
-    const result = await listUnmappedFields({
-      portalId,
-      status,
-      continuationToken,
-      pageSize
-    });
+  const result = await listUnmappedFields({
+    portalId,
+    status,
+    continuationToken,
+    pageSize
+  });
 
-    return jsonResponse(200, result);
-  } catch (error) {
-    context.error('Error listing unmapped fields', error);
-    return handleError(error);
-  }
+  return jsonResponse(200, result);
 };
 
 app.http('ListUnmappedFields', {
   methods: ['GET', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'unmapped-fields',
-  handler: listUnmappedFieldsHandler
+  handler: withHttpHandler('Error listing unmapped fields', listUnmappedFieldsHandler)
 });
-
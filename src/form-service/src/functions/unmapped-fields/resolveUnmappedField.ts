@@ -1,73 +1,63 @@
 import { app, HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
-import { resolveUnmappedField, getUnmappedField } from '../../lib/unmappedFieldRepository';
+import { resolveUnmappedField } from '../../lib/unmappedFieldRepository';
 import { updatePortal } from '../../lib/portalRepository';
 import { getPortal } from '../../lib/portalRepository';
-import { jsonResponse, handleError } from '../../lib/httpResponses';
+import { jsonResponse } from '../../lib/httpResponses';
 import { FieldMapping } from '../../models/portalTypes';
-import { ensureAuthorized } from '../../lib/auth';
-import { handlePreflight } from '../../lib/corsHelper';
+import { withHttpHandler } from '../../lib/httpHandler';
+import { verboseLoggingEnabled } from '../../lib/logging';
 
 const resolveUnmappedFieldHandler = async (
   request: HttpRequest,
   context: InvocationContext
 ): Promise<HttpResponseInit> => {
-  const preflightResponse = handlePreflight(request);
-  if (preflightResponse) return preflightResponse;
-
-  try {
-    ensureAuthorized(request);
-    const fieldId = request.params.fieldId;
-    if (!fieldId) {
-      return jsonResponse(400, { error: 'fieldId is required' });
-    }
+  const fieldId = request.params.fieldId;
+  if (!fieldId) {
+    return jsonResponse(400, { error: 'fieldId is required' });
+  }
 
-    const body = (await request.json()) as {
-      portalId: string;
-      resolvedMapping: FieldMapping;
-      updatePortal?: boolean; // Whether to update portal registry with this mapping
-    };
+  const body = (await request.json()) as {
+    portalId: string;
+    resolvedMapping: FieldMapping;
+    updatePortal?: boolean; // Whether to update portal registry with this mapping
+  };
 
-    if (!body.portalId || !body.resolvedMapping) {
-      return jsonResponse(400, { error: 'portalId and resolvedMapping are required' });
-    }
+  if (!body.portalId || !body.resolvedMapping) {
+    return jsonResponse(400, { error: 'portalId and resolvedMapping are required' });
+  }
 
-    // Get user from auth token (simplified)
-    const resolvedBy = 'system'; // TODO: Extract from auth token
+  // Get user from auth token (simplified)
+  const resolvedBy = 'system'; // TODO: Extract from auth token
 
+  if (verboseLoggingEnabled) {
     context.log('Resolving unmapped field', { fieldId, portalId: body.portalId });
+  }
 
-    // Resolve the unmapped field
-    const resolved = await resolveUnmappedField(
-      fieldId,
-      body.portalId,
-      body.resolvedMapping,
-      resolvedBy
-    );
-
-    // Optionally update portal registry with the new mapping
-    if (body.updatePortal) {
-      const portal = await getPortal(body.portalId);
-      if (portal) {
-        const unmappedField = await getUnmappedField(fieldId, body.portalId);
-        if (unmappedField) {
-          // Add mapping to portal defaults
-          portal.defaultMappings[unmappedField.fieldName] = body.resolvedMapping;
-          await updatePortal(portal);
-        }
-      }
+  // Resolve the unmapped field
+  const resolved = await resolveUnmappedField(
+    fieldId,
+    body.portalId,
+    body.resolvedMapping,
+    resolvedBy
+  );
+
+  // Optionally update portal registry with the new mapping; the resolved
+  // record already carries the field name, so no second fetch is needed
+  if (body.updatePortal) {
+    const portal = await getPortal(body.portalId);
+    if (portal) {
+      // Add mapping to portal defaults
+      portal.defaultMappings[resolved.fieldName] = body.resolvedMapping;
+      await updatePortal(portal);
     }
-
-    return jsonResponse(200, resolved);
-  } catch (error) {
-    context.error('Error resolving unmapped field', error);
-    return handleError(error);
   }
+
+  return jsonResponse(200, resolved);
 };
 
 app.http('ResolveUnmappedField', {
   methods: ['POST', 'OPTIONS'],
   authLevel: 'anonymous',
   route: 'unmapped-fields/{fieldId}/resolve',
-  handler: resolveUnmappedFieldHandler
+  handler: withHttpHandler('Error resolving unmapped field', resolveUnmappedFieldHandler)
 });
-
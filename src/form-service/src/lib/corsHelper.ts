@@ -1,17 +1,21 @@
 import { HttpRequest, HttpResponseInit } from '@azure/functions';
 
-export const CORS_HEADERS = {
+export const CORS_HEADERS = Object.freeze({
   'Access-Control-Allow-Origin': '*',
   'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
   'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-};
+});
+
+// Preflight responses are identical for every request, so build one up front
+// instead of allocating a fresh response per OPTIONS call
+const PREFLIGHT_RESPONSE: HttpResponseInit = Object.freeze({
+  status: 204,
+  headers: CORS_HEADERS
+});
 
 export const handlePreflight = (request: HttpRequest): HttpResponseInit | null => {
   if (request.method === 'OPTIONS') {
-    return {
-      status: 204,
-      headers: CORS_HEADERS
-    };
+    return PREFLIGHT_RESPONSE;
   }
   return null;
 };
@@ -14,55 +14,67 @@ export interface CosmosContainers {
   unmappedFields: Container;
 }
 
-let cachedContainers: CosmosContainers | undefined;
+let cachedContainers: Promise<CosmosContainers> | undefined;
 
-export const getCosmosContainers = async (): Promise<CosmosContainers> => {
-  if (cachedContainers) {
-    return cachedContainers;
+export const getCosmosContainers = (): Promise<CosmosContainers> => {
+  if (!cachedContainers) {
+    const pending = initializeContainers();
+    // Drop a failed initialization so the next request can retry
+    pending.catch(() => {
+      if (cachedContainers === pending) {
+        cachedContainers = undefined;
+      }
+    });
+    cachedContainers = pending;
   }
+  return cachedContainers;
+};
 
-  const config = getConfig();
+const initializeContainers = async (): Promise<CosmosContainers> => {
+  // Bind the cosmos settings once instead of walking config.cosmos.* for
+  // every id and credential below
+  const { cosmos } = getConfig();
   const client = new CosmosClient({
-    endpoint: config.cosmos.endpoint,
-    key: config.cosmos.key
+    endpoint: cosmos.endpoint,
+    key: cosmos.key
   });
 
   const { database } = await client.databases.createIfNotExists({
-    id: config.cosmos.databaseId
+    id: cosmos.databaseId
   });
 
-  const { container: formDefinitions } =
-    await database.containers.createIfNotExists({
-      id: config.cosmos.formDefinitionsContainerId,
+  // The containers are independent of each other, so ensure all four in
+  // one batch instead of paying four sequential round trips on cold start
+  const [
+    { container: formDefinitions },
+    { container: intakeForms },
+    { container: portalRegistry },
+    { container: unmappedFields }
+  ] = await Promise.all([
+    database.containers.createIfNotExists({
+      id: cosmos.formDefinitionsContainerId,
       partitionKey: { paths: ['/insuranceLine'], kind: PartitionKeyKind.Hash }
-    });
-
-  const { container: intakeForms } =
-    await database.containers.createIfNotExists({
-      id: config.cosmos.intakeFormsContainerId,
+    }),
+    database.containers.createIfNotExists({
+      id: cosmos.intakeFormsContainerId,
       partitionKey: { paths: ['/intakeId'], kind: PartitionKeyKind.Hash }
-    });
-
-  const { container: portalRegistry } =
-    await database.containers.createIfNotExists({
-      id: config.cosmos.portalRegistryContainerId,
+    }),
+    database.containers.createIfNotExists({
+      id: cosmos.portalRegistryContainerId,
       partitionKey: { paths: ['/portalId'], kind: PartitionKeyKind.Hash }
-    });
-
-  const { container: unmappedFields } =
-    await database.containers.createIfNotExists({
-      id: config.cosmos.unmappedFieldsContainerId,
+    }),
+    database.containers.createIfNotExists({
+      id: cosmos.unmappedFieldsContainerId,
       partitionKey: { paths: ['/portalId'], kind: PartitionKeyKind.Hash }
-    });
+    })
+  ]);
 
-  cachedContainers = {
+  return {
     database,
     formDefinitions,
     intakeForms,
     portalRegistry,
     unmappedFields
   };
-
-  return cachedContainers;
 };
 
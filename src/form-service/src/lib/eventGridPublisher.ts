@@ -17,34 +17,69 @@ export interface IntakeFormSubmittedEventData {
   formData: Record<string, unknown>;
 }
 
+// Resolved once: either the usable topic config or null when publishing is
+// not configured, so each publish does a single snapshot check instead of
+// re-testing endpoint and key separately. The request headers only depend on
+// the key, so they are frozen into the snapshot rather than rebuilt per post
+let publishTarget:
+  | { topicEndpoint: string; headers: Record<string, string> }
+  | null
+  | undefined;
+
+const getPublishTarget = () => {
+  if (publishTarget === undefined) {
+    const { topicEndpoint, topicKey } = getConfig().eventGrid;
+    publishTarget =
+      topicEndpoint && topicKey
+        ? {
+            topicEndpoint,
+            headers: Object.freeze({
+              'Content-Type': 'application/json',
+              'aeg-sas-key': topicKey
+            })
+          }
+        : null;
+  }
+  return publishTarget;
+};
+
+/**
+ * Whether Event Grid publishing is configured; callers can branch on this
+ * instead of paying an async call that returns immediately
+ */
+export const isEventGridConfigured = (): boolean => getPublishTarget() !== null;
+
+// Envelope fields that never vary between events
+const EVENT_TYPE = 'IntakeFormSubmittedEvent';
+const EVENT_DATA_VERSION = '1.0';
+
 export const publishIntakeFormSubmittedEvent = async (
   intake: FormIntake
 ) => {
-  const config = getConfig();
-  if (!config.eventGrid.topicEndpoint || !config.eventGrid.topicKey) {
+  const target = getPublishTarget();
+  if (!target) {
     return;
   }
 
+  // Read the id once; it stamps the event id, subject, and payload
+  const intakeId = intake.intakeId;
   const event: EventGridEvent<IntakeFormSubmittedEventData> = {
-    id: intake.intakeId,
-    eventType: 'IntakeFormSubmittedEvent',
-    subject: `/intake/${intake.intakeId}`,
+    id: intakeId,
+    eventType: EVENT_TYPE,
+    subject: `/intake/${intakeId}`,
     eventTime: new Date().toISOString(),
-    dataVersion: '1.0',
+    dataVersion: EVENT_DATA_VERSION,
     data: {
-      intakeId: intake.intakeId,
+      intakeId,
       customerId: intake.customerId,
       insuranceLine: intake.insuranceLine,
       formData: intake.formDataNormalized ?? intake.formDataRaw
     }
   };
 
-  await fetch(config.eventGrid.topicEndpoint, {
+  await fetch(target.topicEndpoint, {
     method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'aeg-sas-key': config.eventGrid.topicKey
-    },
+    headers: target.headers,
     body: JSON.stringify([event])
   });
 };
@@ -6,39 +6,60 @@ import { SuggestedMapping } from '../models/portalTypes';
 const levenshteinDistance = (str1: string, str2: string): number => {
   const len1 = str1.length;
   const len2 = str2.length;
-  const matrix: number[][] = [];
 
-  // Initialize matrix
-  for (let i = 0; i <= len1; i++) {
-    matrix[i] = [i];
-  }
+  // Two preallocated rows instead of a full (len1+1) x (len2+1) matrix
+  let previousRow = new Array<number>(len2 + 1);
+  let currentRow = new Array<number>(len2 + 1);
   for (let j = 0; j <= len2; j++) {
-    matrix[0][j] = j;
+    previousRow[j] = j;
   }
 
-  // Fill matrix
   for (let i = 1; i <= len1; i++) {
+    currentRow[0] = i;
     for (let j = 1; j <= len2; j++) {
       const cost = str1[i - 1] === str2[j - 1] ? 0 : 1;
-      matrix[i][j] = Math.min(
-        matrix[i - 1][j] + 1, // deletion
-        matrix[i][j - 1] + 1, // insertion
-        matrix[i - 1][j - 1] + cost // substitution
+      currentRow[j] = Math.min(
+        previousRow[j] + 1, // deletion
+        currentRow[j - 1] + 1, // insertion
+        previousRow[j - 1] + cost // substitution
       );
     }
+    [previousRow, currentRow] = [currentRow, previousRow];
   }
 
-  return matrix[len1][len2];
+  return previousRow[len2];
 };
 
+/**
+ * Field names repeat heavily across suggestion calls (portal schemas and
+ * synonym tables are small and static), so normalization results are
+ * memoized. The cap guards against unbounded growth from arbitrary input.
+ */
+const normalizedNameCache = new Map<string, string>();
+const NORMALIZED_NAME_CACHE_MAX = 1000;
+
+// Hoisted so each normalization reuses the compiled patterns instead of
+// materializing fresh regex objects per call
+const SEPARATOR_PATTERN = /[_-]/g;
+const WHITESPACE_PATTERN = /\s+/g;
+
 /**
  * Normalize field name for comparison (lowercase, remove special chars)
  */
 export const normalizeFieldName = (fieldName: string): string => {
-  return fieldName
+  const cached = normalizedNameCache.get(fieldName);
+  if (cached !== undefined) {
+    return cached;
+  }
+  const normalized = fieldName
     .toLowerCase()
-    .replace(/[_-]/g, '') // Remove underscores and hyphens
-    .replace(/\s+/g, ''); // Remove whitespace
+    .replace(SEPARATOR_PATTERN, '') // Remove underscores and hyphens
+    .replace(WHITESPACE_PATTERN, ''); // Remove whitespace
+  if (normalizedNameCache.size >= NORMALIZED_NAME_CACHE_MAX) {
+    normalizedNameCache.clear();
+  }
+  normalizedNameCache.set(fieldName, normalized);
+  return normalized;
 };
 
 /**
@@ -46,9 +67,14 @@ export const normalizeFieldName = (fieldName: string): string => {
  * Uses Levenshtein distance on normalized names
  */
 export const calculateSimilarity = (field1: string, field2: string): number => {
-  const normalized1 = normalizeFieldName(field1);
-  const normalized2 = normalizeFieldName(field2);
+  return similarityOfNormalized(normalizeFieldName(field1), normalizeFieldName(field2));
+};
 
+/**
+ * Similarity core operating on already-normalized names, so callers that
+ * hold pre-normalized values (e.g. synonym variants) skip re-normalization
+ */
+const similarityOfNormalized = (normalized1: string, normalized2: string): number => {
   // Exact match after normalization
   if (normalized1 === normalized2) {
     return 1.0;
@@ -93,7 +119,7 @@ export const calculateSimilarity = (field1: string, field2: string): number => {
 /**
  * Field name synonyms for better matching
  */
-const FIELD_SYNONYMS: Record<string, string[]> = {
+const FIELD_SYNONYMS: Record<string, string[]> = Object.freeze({
   firstName: ['firstname', 'first_name', 'fname', 'givenname', 'given_name', 'first'],
   lastName: ['lastname', 'last_name', 'lname', 'surname', 'familyname', 'family_name', 'last'],
   email: ['emailaddress', 'email_address', 'e-mail', 'mail'],
@@ -104,61 +130,63 @@ const FIELD_SYNONYMS: Record<string, string[]> = {
   zip: ['zipcode', 'zip_code', 'postalcode', 'postal_code', 'postcode'],
   dateOfBirth: ['dob', 'birthdate', 'birth_date', 'dateofbirth'],
   ssn: ['socialsecuritynumber', 'social_security_number', 'ssnumber']
-};
+});
 
 /**
- * Expand field name with synonyms for matching
+ * Normalized synonym groups precomputed at module load so expansion is a
+ * single map lookup instead of re-normalizing every synonym per call
  */
-const expandWithSynonyms = (fieldName: string): string[] => {
-  const normalized = normalizeFieldName(fieldName);
-  const variants = [normalized];
-
-  // Check if field matches any synonym key
+const SYNONYM_VARIANTS: Map<string, string[]> = (() => {
+  const variantsByName = new Map<string, string[]>();
   for (const [key, synonyms] of Object.entries(FIELD_SYNONYMS)) {
-    if (normalized === normalizeFieldName(key)) {
-      variants.push(...synonyms.map(s => normalizeFieldName(s)));
-      break;
-    }
-    // Check if field matches any synonym
-    for (const synonym of synonyms) {
-      if (normalized === normalizeFieldName(synonym)) {
-        variants.push(normalizeFieldName(key), ...synonyms.map(s => normalizeFieldName(s)));
-        break;
-      }
+    const group = [
+      ...new Set([normalizeFieldName(key), ...synonyms.map((s) => normalizeFieldName(s))])
+    ];
+    for (const variant of group) {
+      variantsByName.set(variant, group);
     }
   }
+  return variantsByName;
+})();
 
-  return [...new Set(variants)]; // Remove duplicates
+/**
+ * Expand field name with synonyms for matching
+ */
+const expandWithSynonyms = (fieldName: string): string[] => {
+  const normalized = normalizeFieldName(fieldName);
+  return SYNONYM_VARIANTS.get(normalized) ?? [normalized];
 };
 
+type NormalizedSource = [sourceField: string, normalized: string];
+
 /**
- * Suggest field mappings based on similarity
+ * Score one target field against pre-normalized source names
  */
-export const suggestMappings = (
+const suggestForNormalizedSources = (
   targetField: string,
-  sourceFields: string[],
-  maxResults: number = 3
+  normalizedSources: NormalizedSource[],
+  maxResults: number
 ): SuggestedMapping[] => {
-  if (sourceFields.length === 0) {
-    return [];
-  }
-
   const targetVariants = expandWithSynonyms(targetField);
   const scores: Array<{ sourceField: string; confidence: number }> = [];
 
-  for (const sourceField of sourceFields) {
+  for (const [sourceField, normalizedSource] of normalizedSources) {
     let maxSimilarity = 0;
 
-    // Check similarity against all target variants
+    // Check similarity against all target variants; the variants always
+    // include the normalized target itself, and similarity is computed on
+    // normalized names, so a separate direct comparison would be redundant.
+    // Sources and variants are already normalized, so the inner loop does
+    // no string conversion at all.
     for (const targetVariant of targetVariants) {
-      const similarity = calculateSimilarity(sourceField, targetVariant);
+      const similarity = similarityOfNormalized(normalizedSource, targetVariant);
       maxSimilarity = Math.max(maxSimilarity, similarity);
+      // An exact match cannot be beaten; skip the remaining variants
+      if (maxSimilarity === 1) {
+        break;
+      }
     }
 
-    // Also check direct similarity
-    const directSimilarity = calculateSimilarity(sourceField, targetField);
-    maxSimilarity = Math.max(maxSimilarity, directSimilarity);
-
     if (maxSimilarity > 0.3) { // Minimum threshold
       scores.push({
         sourceField,
@@ -167,13 +195,68 @@ export const suggestMappings = (
     }
   }
 
-  // Sort by confidence (descending) and limit results
-  return scores
+  // Sort by confidence (descending) and limit results; round in place so the
+  // already-shaped score objects are reused instead of re-allocated
+  const top = scores
     .sort((a, b) => b.confidence - a.confidence)
-    .slice(0, maxResults)
-    .map(({ sourceField, confidence }) => ({
+    .slice(0, maxResults);
+  for (const score of top) {
+    score.confidence = Math.round(score.confidence * 100) / 100; // Round to 2 decimal places
+  }
+  return top;
+};
+
+/**
+ * Suggest field mappings based on similarity
+ */
+export const suggestMappings = (
+  targetField: string,
+  sourceFields: string[],
+  maxResults: number = 3
+): SuggestedMapping[] => {
+  if (sourceFields.length === 0) {
+    return [];
+  }
+
+  return suggestForNormalizedSources(
+    targetField,
+    sourceFields.map((sourceField): NormalizedSource => [
       sourceField,
-      confidence: Math.round(confidence * 100) / 100 // Round to 2 decimal places
-    }));
+      normalizeFieldName(sourceField)
+    ]),
+    maxResults
+  );
+};
+
+/**
+ * Suggest mappings for a batch of target fields against the same sources.
+ * The source names are normalized once up front rather than once per target,
+ * so scoring T targets against S sources normalizes S strings, not T x S.
+ */
+export const suggestMappingsForTargets = (
+  targetFields: string[],
+  sourceFields: string[],
+  maxResults: number = 3
+): Record<string, SuggestedMapping[]> => {
+  const suggestions: Record<string, SuggestedMapping[]> = {};
+  if (sourceFields.length === 0) {
+    for (const targetField of targetFields) {
+      suggestions[targetField] = [];
+    }
+    return suggestions;
+  }
+
+  const normalizedSources = sourceFields.map((sourceField): NormalizedSource => [
+    sourceField,
+    normalizeFieldName(sourceField)
+  ]);
+  for (const targetField of targetFields) {
+    suggestions[targetField] = suggestForNormalizedSources(
+      targetField,
+      normalizedSources,
+      maxResults
+    );
+  }
+  return suggestions;
 };
 
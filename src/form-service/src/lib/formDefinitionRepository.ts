@@ -5,6 +5,9 @@ import { getCosmosContainers } from './cosmosClient';
 
 const SOFT_DELETE_FILTER = 'c.isDeleted != true OR NOT IS_DEFINED(c.isDeleted)';
 
+// Query text is invariant; only the parameters change per call
+const GET_TEMPLATE_QUERY = `SELECT * FROM c WHERE c.templateId = @templateId AND c.insuranceLine = @insuranceLine AND (${SOFT_DELETE_FILTER})`;
+
 const buildListQuery = (
   insuranceLine?: string,
   status?: string,
@@ -36,9 +39,24 @@ const buildListQuery = (
   };
 };
 
-const getContainer = async (): Promise<Container> => {
-  const { formDefinitions } = await getCosmosContainers();
-  return formDefinitions;
+// The container handle is fixed for the process lifetime, so resolve it once
+// instead of destructuring the container set on every repository call
+let containerPromise: Promise<Container> | undefined;
+
+const getContainer = (): Promise<Container> => {
+  if (!containerPromise) {
+    const pending = getCosmosContainers().then(
+      (containers) => containers.formDefinitions
+    );
+    // Drop a failed resolution so the next call can retry
+    pending.catch(() => {
+      if (containerPromise === pending) {
+        containerPromise = undefined;
+      }
+    });
+    containerPromise = pending;
+  }
+  return containerPromise;
 };
 
 export const listFormTemplates = async (options: {
@@ -70,7 +88,7 @@ export const getFormTemplate = async (
   try {
     // Query by templateId field instead of document id
     const querySpec = {
-      query: `SELECT * FROM c WHERE c.templateId = @templateId AND c.insuranceLine = @insuranceLine AND (${SOFT_DELETE_FILTER})`,
+      query: GET_TEMPLATE_QUERY,
       parameters: [
         { name: '@templateId', value: templateId },
         { name: '@insuranceLine', value: insuranceLine }
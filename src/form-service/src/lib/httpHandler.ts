@@ -0,0 +1,37 @@
+import {
+  HttpHandler,
+  HttpRequest,
+  HttpResponseInit,
+  InvocationContext
+} from '@azure/functions';
+import { ensureAuthorized } from './auth';
+import { handlePreflight } from './corsHelper';
+import { handleError } from './httpResponses';
+
+/**
+ * Wrap an endpoint handler with the preflight, authorization, and
+ * error-handling boilerplate that every HTTP function repeats, so the
+ * function files contain only their own logic. The wrapper is built once at
+ * registration time; per-request work is the same checks the handlers
+ * previously inlined.
+ */
+export const withHttpHandler = (
+  errorMessage: string,
+  handler: (
+    request: HttpRequest,
+    context: InvocationContext
+  ) => Promise<HttpResponseInit>
+): HttpHandler => {
+  return async (request, context) => {
+    const preflightResponse = handlePreflight(request);
+    if (preflightResponse) return preflightResponse;
+
+    try {
+      ensureAuthorized(request);
+      return await handler(request, context);
+    } catch (error) {
+      context.error(errorMessage, error);
+      return handleError(error);
+    }
+  };
+};
@@ -1,11 +1,12 @@
 import { HttpResponseInit } from '@azure/functions';
+import { CORS_HEADERS as SHARED_CORS_HEADERS } from './corsHelper';
 
-const CORS_HEADERS = {
+// Derived once from the shared CORS constant so the two modules cannot
+// drift, and every response reuses the same frozen header map
+const CORS_HEADERS = Object.freeze({
   'Content-Type': 'application/json',
-  'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-  'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-};
+  ...SHARED_CORS_HEADERS
+});
 
 export const jsonResponse = (
   status: number,
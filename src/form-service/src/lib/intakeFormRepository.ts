@@ -3,24 +3,49 @@ import { v4 as uuid } from 'uuid';
 import { FormIntake } from '../models/formTypes';
 import { getCosmosContainers } from './cosmosClient';
 
-const getContainer = async (): Promise<Container> => {
-  const { intakeForms } = await getCosmosContainers();
-  return intakeForms;
+// The container handle is fixed for the process lifetime, so resolve it once
+// instead of destructuring the container set on every repository call
+let containerPromise: Promise<Container> | undefined;
+
+const getContainer = (): Promise<Container> => {
+  if (!containerPromise) {
+    const pending = getCosmosContainers().then(
+      (containers) => containers.intakeForms
+    );
+    // Drop a failed resolution so the next call can retry
+    pending.catch(() => {
+      if (containerPromise === pending) {
+        containerPromise = undefined;
+      }
+    });
+    containerPromise = pending;
+  }
+  return containerPromise;
 };
 
-export const createDraftIntake = async (
+/**
+ * Build a new draft intake document without persisting it. Callers that
+ * immediately replace the draft (e.g. direct submission) can skip the
+ * intermediate write, since its output would never be read.
+ */
+export const buildDraftIntake = (
   intake: Omit<FormIntake, 'id' | 'intakeId' | 'createdAt'>
-): Promise<FormIntake> => {
-  const container = await getContainer();
-  const now = new Date().toISOString();
+): FormIntake => {
   const intakeId = uuid();
-  const newIntake: FormIntake = {
+  return {
     ...intake,
     id: intakeId,
     intakeId: intakeId,
-    createdAt: now,
+    createdAt: new Date().toISOString(),
     isDeleted: false,
   };
+};
+
+export const createDraftIntake = async (
+  intake: Omit<FormIntake, 'id' | 'intakeId' | 'createdAt'>
+): Promise<FormIntake> => {
+  const container = await getContainer();
+  const newIntake = buildDraftIntake(intake);
   await container.items.create(newIntake);
   return newIntake;
 };
@@ -31,7 +56,9 @@ export const getIntake = async (
   const container = await getContainer();
   try {
     const { resource } = await container.item(intakeId, intakeId).read();
-    return resource as FormIntake;
+    // The SDK can resolve without a resource; normalize that to null instead
+    // of leaking undefined through the error path
+    return (resource as FormIntake | undefined) ?? null;
   } catch (error) {
     return null;
   }
@@ -51,6 +78,10 @@ export const upsertIntake = async (
   return updated;
 };
 
+// Query text is invariant; only the parameters change per call
+const LIST_BY_TEMPLATE_QUERY =
+  'SELECT * FROM c WHERE c.templateId = @templateId ORDER BY c._ts DESC';
+
 export const listIntakesByTemplate = async (
   templateId: string,
   continuationToken?: string
@@ -58,8 +89,7 @@ export const listIntakesByTemplate = async (
   const container = await getContainer();
   const iterator = container.items.query<FormIntake>(
     {
-      query:
-        'SELECT * FROM c WHERE c.templateId = @templateId ORDER BY c._ts DESC',
+      query: LIST_BY_TEMPLATE_QUERY,
       parameters: [{ name: '@templateId', value: templateId }]
     },
     {
@@ -69,16 +99,20 @@ export const listIntakesByTemplate = async (
   return iterator.fetchNext();
 };
 
+// Filter fragments are invariant, so they live at module level instead of
+// being re-literalized on every list call
+const SOFT_DELETE_FILTER = '(c.isDeleted != true OR NOT IS_DEFINED(c.isDeleted))';
+const SEARCH_FILTER =
+  '(CONTAINS(LOWER(c.intakeId), LOWER(@search)) OR CONTAINS(LOWER(c.templateId), LOWER(@search)) OR CONTAINS(LOWER(c.customerId), LOWER(@search)))';
+
 const buildListAllIntakesQuery = (
   status?: string,
   insuranceLine?: string,
   search?: string
 ): SqlQuerySpec => {
-  const filters: string[] = [];
-  const parameters: SqlParameter[] = [];
-
   // Filter out deleted intakes
-  filters.push('(c.isDeleted != true OR NOT IS_DEFINED(c.isDeleted))');
+  const filters: string[] = [SOFT_DELETE_FILTER];
+  const parameters: SqlParameter[] = [];
 
   if (status && status !== 'all') {
     filters.push('c.status = @status');
@@ -91,9 +125,7 @@ const buildListAllIntakesQuery = (
   }
 
   if (search) {
-    filters.push(
-      '(CONTAINS(LOWER(c.intakeId), LOWER(@search)) OR CONTAINS(LOWER(c.templateId), LOWER(@search)) OR CONTAINS(LOWER(c.customerId), LOWER(@search)))'
-    );
+    filters.push(SEARCH_FILTER);
     parameters.push({ name: '@search', value: search });
   }
 
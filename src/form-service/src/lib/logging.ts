@@ -0,0 +1,7 @@
+/**
+ * Per-request diagnostic logging is gated behind an app setting so hot
+ * handlers skip building log payload objects when the logs would only be
+ * dropped. Read once at load; app setting changes recycle the worker.
+ */
+export const verboseLoggingEnabled =
+  (process.env.VERBOSE_REQUEST_LOGGING ?? '').toLowerCase() === 'true';
@@ -4,26 +4,46 @@ import { getCosmosContainers } from './cosmosClient';
 
 const SOFT_DELETE_FILTER = 'c.isDeleted != true OR NOT IS_DEFINED(c.isDeleted)';
 
-const buildListQuery = (search?: string): SqlQuerySpec => {
-  const filters = [SOFT_DELETE_FILTER];
-  const parameters: SqlParameter[] = [];
+// Query text is invariant; only the parameters change per call
+const GET_PORTAL_QUERY = `SELECT * FROM c WHERE c.portalId = @portalId AND (${SOFT_DELETE_FILTER})`;
+
+const SEARCH_FILTER =
+  '(CONTAINS(LOWER(c.name), LOWER(@search)) OR CONTAINS(LOWER(c.description), LOWER(@search)) OR CONTAINS(LOWER(c.portalId), LOWER(@search)))';
+
+// Both list shapes are known ahead of time, so the texts are assembled once
+// rather than joined per call
+const LIST_ALL_QUERY = `SELECT * FROM c WHERE ${SOFT_DELETE_FILTER} ORDER BY c._ts DESC`;
+const LIST_SEARCH_QUERY = `SELECT * FROM c WHERE ${SOFT_DELETE_FILTER} AND ${SEARCH_FILTER} ORDER BY c._ts DESC`;
 
+const buildListQuery = (search?: string): SqlQuerySpec => {
   if (search) {
-    filters.push(
-      '(CONTAINS(LOWER(c.name), LOWER(@search)) OR CONTAINS(LOWER(c.description), LOWER(@search)) OR CONTAINS(LOWER(c.portalId), LOWER(@search)))'
-    );
-    parameters.push({ name: '@search', value: search });
+    return {
+      query: LIST_SEARCH_QUERY,
+      parameters: [{ name: '@search', value: search }]
+    };
   }
 
-  return {
-    query: `SELECT * FROM c WHERE ${filters.join(' AND ')} ORDER BY c._ts DESC`,
-    parameters
-  };
+  return { query: LIST_ALL_QUERY, parameters: [] };
 };
 
-const getContainer = async (): Promise<Container> => {
-  const { portalRegistry } = await getCosmosContainers();
-  return portalRegistry;
+// The container handle is fixed for the process lifetime, so resolve it once
+// instead of destructuring the container set on every repository call
+let containerPromise: Promise<Container> | undefined;
+
+const getContainer = (): Promise<Container> => {
+  if (!containerPromise) {
+    const pending = getCosmosContainers().then(
+      (containers) => containers.portalRegistry
+    );
+    // Drop a failed resolution so the next call can retry
+    pending.catch(() => {
+      if (containerPromise === pending) {
+        containerPromise = undefined;
+      }
+    });
+    containerPromise = pending;
+  }
+  return containerPromise;
 };
 
 export const listPortals = async (options: {
@@ -47,7 +67,7 @@ export const getPortal = async (
   const container = await getContainer();
   try {
     const querySpec = {
-      query: `SELECT * FROM c WHERE c.portalId = @portalId AND (${SOFT_DELETE_FILTER})`,
+      query: GET_PORTAL_QUERY,
       parameters: [{ name: '@portalId', value: portalId }]
     };
 
@@ -86,7 +106,9 @@ export const updatePortal = async (
   const updated: PortalDefinition = {
     ...portal,
     updatedAt: new Date().toISOString(),
-    isDeleted: false
+    // Preserve the caller's flag: forcing false here silently resurrected
+    // soft-deleted portals and made softDeletePortal a no-op
+    isDeleted: portal.isDeleted ?? false
   };
   await container.items.upsert(updated);
   return updated;
@@ -0,0 +1,18 @@
+/**
+ * Parse a pageSize query value into a bounded positive integer.
+ * Returns undefined for missing or non-numeric input so callers fall back
+ * to the repository default instead of passing NaN through to Cosmos.
+ */
+export const parsePageSize = (
+  value: string | null,
+  max: number = 100
+): number | undefined => {
+  if (!value) {
+    return undefined;
+  }
+  const parsed = Number(value);
+  if (!Number.isInteger(parsed) || parsed <= 0) {
+    return undefined;
+  }
+  return Math.min(parsed, max);
+};
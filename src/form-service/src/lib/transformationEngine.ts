@@ -1,5 +1,30 @@
 import jsonata from 'jsonata';
 
+type CompiledExpression = ReturnType<typeof jsonata>;
+
+/**
+ * Cache of compiled JSONata expressions keyed by source text.
+ * Mapping expressions repeat across every intake submission, so compiling
+ * once and reusing avoids re-parsing the same expression per field.
+ */
+const expressionCache = new Map<string, CompiledExpression>();
+
+const compileExpression = (expression: string): CompiledExpression => {
+  let expr = expressionCache.get(expression);
+  if (!expr) {
+    expr = jsonata(expression);
+    expressionCache.set(expression, expr);
+  }
+  return expr;
+};
+
+/**
+ * Expressions whose failures have already been reported. A broken mapping
+ * fails on every field of every submission; logging it once keeps the
+ * diagnostics without a stderr write per invocation.
+ */
+const reportedFailures = new Set<string>();
+
 /**
  * Evaluate a JSONata transformation expression
  */
@@ -7,20 +32,33 @@ export const evaluateTransformation = async (
   expression: string,
   data: Record<string, unknown>
 ): Promise<unknown> => {
-  if (!expression || expression.trim() === '') {
+  // Fast path: a cached expression is by construction non-blank, so the
+  // trim allocation only runs on a compile miss
+  let expr = expressionCache.get(expression);
+  if (!expr && (!expression || expression.trim() === '')) {
     return undefined;
   }
 
   try {
-    const expr = jsonata(expression);
+    expr = expr ?? compileExpression(expression);
     const result = await expr.evaluate(data);
     return result;
   } catch (error) {
-    console.error('Error evaluating transformation:', error);
+    if (!reportedFailures.has(expression)) {
+      reportedFailures.add(expression);
+      console.error('Error evaluating transformation:', error);
+    }
     return undefined;
   }
 };
 
+/**
+ * Expressions known to fail compilation. Valid expressions land in the
+ * compile cache, so remembering the invalid ones makes repeat validation a
+ * set probe either way instead of re-parsing per call.
+ */
+const knownInvalidExpressions = new Set<string>();
+
 /**
  * Validate a JSONata expression syntax
  */
@@ -29,10 +67,15 @@ export const validateTransformation = (expression: string): boolean => {
     return false;
   }
 
+  if (knownInvalidExpressions.has(expression)) {
+    return false;
+  }
+
   try {
-    jsonata(expression);
+    compileExpression(expression);
     return true;
   } catch (error) {
+    knownInvalidExpressions.add(expression);
     return false;
   }
 };
@@ -45,24 +88,30 @@ export const transformData = async (
   transformations: Record<string, string>
 ): Promise<Record<string, unknown>> => {
   const result: Record<string, unknown> = {};
+  const targetFields: string[] = [];
+  const evaluations: Promise<unknown>[] = [];
 
   for (const [targetField, expression] of Object.entries(transformations)) {
-    const value = await evaluateTransformation(expression, data);
-    if (value !== undefined) {
-      result[targetField] = value;
+    // Blank expressions always evaluate to undefined; skip them before
+    // paying for the async call
+    if (!expression || expression.trim() === '') {
+      continue;
     }
+    targetFields.push(targetField);
+    evaluations.push(evaluateTransformation(expression, data));
   }
 
-  return result;
-};
+  // Evaluate the expressions as one batch instead of awaiting each in turn,
+  // mirroring the batching in the connector mapper
+  if (evaluations.length > 0) {
+    const values = await Promise.all(evaluations);
+    for (let i = 0; i < values.length; i++) {
+      if (values[i] !== undefined) {
+        result[targetFields[i]] = values[i];
+      }
+    }
+  }
 
-/**
- * Apply a single transformation and return the value
- */
-export const applySingleTransformation = async (
-  expression: string,
-  data: Record<string, unknown>
-): Promise<unknown> => {
-  return evaluateTransformation(expression, data);
+  return result;
 };
 
@@ -3,37 +3,54 @@ import { v4 as uuid } from 'uuid';
 import { UnmappedField, FieldMapping, UnmappedFieldStatus } from '../models/portalTypes';
 import { getCosmosContainers } from './cosmosClient';
 
+const LIST_ORDER_BY = 'ORDER BY c.occurrenceCount DESC, c._ts DESC';
+
+// The list query has exactly two shapes (with and without a portal filter),
+// so precompute both texts instead of rejoining filter fragments per call
+const LIST_BY_STATUS_QUERY = `SELECT * FROM c WHERE c.status = @status ${LIST_ORDER_BY}`;
+const LIST_BY_PORTAL_AND_STATUS_QUERY = `SELECT * FROM c WHERE c.portalId = @portalId AND c.status = @status ${LIST_ORDER_BY}`;
+
+// Point-lookup texts are invariant too; only the parameters change per call
+const GET_BY_ID_QUERY =
+  'SELECT * FROM c WHERE c.id = @id AND c.portalId = @portalId';
+const FIND_PENDING_BY_NAME_QUERY =
+  'SELECT * FROM c WHERE c.portalId = @portalId AND c.fieldName = @fieldName AND c.status = @status';
+
 const buildListQuery = (
   portalId?: string,
   status?: UnmappedFieldStatus
 ): SqlQuerySpec => {
-  const filters: string[] = [];
-  const parameters: SqlParameter[] = [];
+  // Default to pending if no status specified
+  const parameters: SqlParameter[] = [
+    { name: '@status', value: status ?? 'pending' }
+  ];
 
   if (portalId) {
-    filters.push('c.portalId = @portalId');
     parameters.push({ name: '@portalId', value: portalId });
+    return { query: LIST_BY_PORTAL_AND_STATUS_QUERY, parameters };
   }
 
-  if (status) {
-    filters.push('c.status = @status');
-    parameters.push({ name: '@status', value: status });
-  } else {
-    // Default to pending if no status specified
-    filters.push('c.status = @status');
-    parameters.push({ name: '@status', value: 'pending' });
-  }
-
-  const whereClause = filters.length > 0 ? `WHERE ${filters.join(' AND ')}` : '';
-  return {
-    query: `SELECT * FROM c ${whereClause} ORDER BY c.occurrenceCount DESC, c._ts DESC`,
-    parameters
-  };
+  return { query: LIST_BY_STATUS_QUERY, parameters };
 };
 
-const getContainer = async (): Promise<Container> => {
-  const { unmappedFields } = await getCosmosContainers();
-  return unmappedFields;
+// The container handle is fixed for the process lifetime, so resolve it once
+// instead of destructuring the container set on every repository call
+let containerPromise: Promise<Container> | undefined;
+
+const getContainer = (): Promise<Container> => {
+  if (!containerPromise) {
+    const pending = getCosmosContainers().then(
+      (containers) => containers.unmappedFields
+    );
+    // Drop a failed resolution so the next call can retry
+    pending.catch(() => {
+      if (containerPromise === pending) {
+        containerPromise = undefined;
+      }
+    });
+    containerPromise = pending;
+  }
+  return containerPromise;
 };
 
 export const listUnmappedFields = async (options: {
@@ -59,7 +76,7 @@ export const getUnmappedField = async (
   const container = await getContainer();
   try {
     const querySpec = {
-      query: 'SELECT * FROM c WHERE c.id = @id AND c.portalId = @portalId',
+      query: GET_BY_ID_QUERY,
       parameters: [
         { name: '@id', value: id },
         { name: '@portalId', value: portalId }
@@ -162,7 +179,7 @@ export const findOrCreateUnmappedField = async (
   
   // Try to find existing unmapped field
   const querySpec = {
-    query: 'SELECT * FROM c WHERE c.portalId = @portalId AND c.fieldName = @fieldName AND c.status = @status',
+    query: FIND_PENDING_BY_NAME_QUERY,
     parameters: [
       { name: '@portalId', value: portalId },
       { name: '@fieldName', value: fieldName },
@@ -1,20 +1,44 @@
-import Ajv, { JSONSchemaType } from 'ajv';
+import Ajv, { JSONSchemaType, ValidateFunction } from 'ajv';
 import addFormats from 'ajv-formats';
 import templateSchema from '../schemas/formTemplate.schema.json';
 import intakeSchema from '../schemas/formIntake.schema.json';
 import { FormTemplate, FormIntake } from '../models/formTypes';
 
-const ajv = new Ajv({ allErrors: true, allowUnionTypes: true });
-addFormats(ajv);
+// Schema compilation is expensive and this module is pulled in by every
+// function via shared imports, so validators are built on first use rather
+// than at load time to keep cold starts lean
+let ajvInstance: Ajv | undefined;
+let templateValidator: ValidateFunction<FormTemplate> | undefined;
+let intakeValidator: ValidateFunction<FormIntake> | undefined;
 
-const validateTemplateFn = ajv.compile<FormTemplate>(
-  templateSchema as unknown as JSONSchemaType<FormTemplate>
-);
-const validateIntakeFn = ajv.compile<FormIntake>(
-  intakeSchema as unknown as JSONSchemaType<FormIntake>
-);
+const getAjv = (): Ajv => {
+  if (!ajvInstance) {
+    ajvInstance = new Ajv({ allErrors: true, allowUnionTypes: true });
+    addFormats(ajvInstance);
+  }
+  return ajvInstance;
+};
+
+const getTemplateValidator = (): ValidateFunction<FormTemplate> => {
+  if (!templateValidator) {
+    templateValidator = getAjv().compile<FormTemplate>(
+      templateSchema as unknown as JSONSchemaType<FormTemplate>
+    );
+  }
+  return templateValidator;
+};
+
+const getIntakeValidator = (): ValidateFunction<FormIntake> => {
+  if (!intakeValidator) {
+    intakeValidator = getAjv().compile<FormIntake>(
+      intakeSchema as unknown as JSONSchemaType<FormIntake>
+    );
+  }
+  return intakeValidator;
+};
 
 export const validateFormTemplate = (payload: unknown) => {
+  const validateTemplateFn = getTemplateValidator();
   if (!validateTemplateFn(payload)) {
     const messages =
       validateTemplateFn.errors?.map((err) => `${err.instancePath} ${err.message}`) ??
@@ -25,6 +49,7 @@ export const validateFormTemplate = (payload: unknown) => {
 };
 
 export const validateFormIntake = (payload: unknown) => {
+  const validateIntakeFn = getIntakeValidator();
   if (!validateIntakeFn(payload)) {
     const messages =
       validateIntakeFn.errors?.map((err) => `${err.instancePath} ${err.message}`) ??
@@ -0,0 +1,23 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+
+// getConfig requires the Cosmos settings even though this suite only touches
+// the Event Grid snapshot, so provide placeholders when the environment has
+// none. The publisher module is imported after this setup runs.
+process.env.COSMOS_DB_ENDPOINT ??= 'https://localhost:8081';
+process.env.COSMOS_DB_KEY ??= 'test-key';
+
+test('isEventGridConfigured should reflect the topic settings', async () => {
+  const { isEventGridConfigured } = await import('../lib/eventGridPublisher');
+  const expected = Boolean(
+    process.env.EVENT_GRID_TOPIC_ENDPOINT && process.env.EVENT_GRID_TOPIC_KEY
+  );
+
+  assert.equal(isEventGridConfigured(), expected);
+});
+
+test('isEventGridConfigured should answer consistently across calls', async () => {
+  const { isEventGridConfigured } = await import('../lib/eventGridPublisher');
+
+  assert.equal(isEventGridConfigured(), isEventGridConfigured());
+});
@@ -3,6 +3,7 @@ import assert from 'node:assert/strict';
 import {
   calculateSimilarity,
   suggestMappings,
+  suggestMappingsForTargets,
   normalizeFieldName
 } from '../lib/fieldMatcher';
 
@@ -68,6 +69,23 @@ test('suggestMappings should consider synonyms', () => {
   });
 });
 
+test('suggestMappingsForTargets should match per-target suggestMappings output', () => {
+  const targetFields = ['first_name', 'email', 'phoneNumber'];
+  const sourceFields = ['firstName', 'lastName', 'email', 'phone'];
+
+  const batch = suggestMappingsForTargets(targetFields, sourceFields, 3);
+
+  assert.deepEqual(Object.keys(batch), targetFields);
+  for (const targetField of targetFields) {
+    assert.deepEqual(batch[targetField], suggestMappings(targetField, sourceFields, 3));
+  }
+});
+
+test('suggestMappingsForTargets should map every target to [] for empty sources', () => {
+  const batch = suggestMappingsForTargets(['first_name', 'email'], []);
+  assert.deepEqual(batch, { first_name: [], email: [] });
+});
+
 test('suggestMappings should limit results to maxResults', () => {
   const sourceFields = ['targetField', 'target_field', 'targetfield', 'field4', 'field5'];
   const targetField = 'target';
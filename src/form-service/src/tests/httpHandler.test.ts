@@ -0,0 +1,47 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { HttpRequest, HttpResponseInit, InvocationContext } from '@azure/functions';
+import { withHttpHandler } from '../lib/httpHandler';
+
+const makeRequest = (method: string): HttpRequest =>
+  ({ method } as unknown as HttpRequest);
+
+const makeContext = () => {
+  const errors: unknown[][] = [];
+  const context = {
+    error: (...args: unknown[]) => {
+      errors.push(args);
+    }
+  } as unknown as InvocationContext;
+  return { context, errors };
+};
+
+test('withHttpHandler should short-circuit OPTIONS preflight requests', async () => {
+  const handler = withHttpHandler('Error in test', async () => ({ status: 200 }));
+  const { context } = makeContext();
+
+  const response = (await handler(makeRequest('OPTIONS'), context)) as HttpResponseInit;
+  assert.equal(response.status, 204);
+});
+
+test('withHttpHandler should pass through the wrapped handler response', async () => {
+  const expected: HttpResponseInit = { status: 201, jsonBody: { ok: true } };
+  const handler = withHttpHandler('Error in test', async () => expected);
+  const { context } = makeContext();
+
+  const response = await handler(makeRequest('POST'), context);
+  assert.equal(response, expected);
+});
+
+test('withHttpHandler should log and convert thrown errors', async () => {
+  const handler = withHttpHandler('Error in test', async () => {
+    throw new Error('boom');
+  });
+  const { context, errors } = makeContext();
+
+  const response = (await handler(makeRequest('GET'), context)) as HttpResponseInit;
+  assert.equal(response.status, 400);
+  assert.deepEqual(response.jsonBody, { error: 'boom' });
+  assert.equal(errors.length, 1);
+  assert.equal(errors[0][0], 'Error in test');
+});
@@ -0,0 +1,42 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { buildDraftIntake } from '../lib/intakeFormRepository';
+
+const draftInput = {
+  templateId: 'template-1',
+  insuranceLine: 'auto',
+  customerId: 'customer-1',
+  status: 'draft' as const,
+  formDataRaw: { firstName: 'Ada' },
+  formDataNormalized: {}
+};
+
+test('buildDraftIntake should assign a shared id and intakeId', () => {
+  const draft = buildDraftIntake(draftInput);
+
+  assert.ok(draft.intakeId);
+  assert.equal(draft.id, draft.intakeId);
+});
+
+test('buildDraftIntake should stamp creation metadata', () => {
+  const draft = buildDraftIntake(draftInput);
+
+  assert.ok(!Number.isNaN(Date.parse(draft.createdAt)));
+  assert.equal(draft.isDeleted, false);
+});
+
+test('buildDraftIntake should preserve the caller fields', () => {
+  const draft = buildDraftIntake(draftInput);
+
+  assert.equal(draft.templateId, 'template-1');
+  assert.equal(draft.insuranceLine, 'auto');
+  assert.equal(draft.customerId, 'customer-1');
+  assert.deepEqual(draft.formDataRaw, { firstName: 'Ada' });
+});
+
+test('buildDraftIntake should generate a fresh id per draft', () => {
+  const first = buildDraftIntake(draftInput);
+  const second = buildDraftIntake(draftInput);
+
+  assert.notEqual(first.intakeId, second.intakeId);
+});
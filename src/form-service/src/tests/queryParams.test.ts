@@ -0,0 +1,39 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { parsePageSize } from '../lib/queryParams';
+
+test('parsePageSize should return undefined for missing input', () => {
+  assert.equal(parsePageSize(null), undefined);
+  assert.equal(parsePageSize(''), undefined);
+});
+
+test('parsePageSize should return undefined for non-numeric input', () => {
+  assert.equal(parsePageSize('abc'), undefined);
+  // Trailing garbage no longer parses like parseInt('50abc') did
+  assert.equal(parsePageSize('50abc'), undefined);
+});
+
+test('parsePageSize should return undefined for non-integer numbers', () => {
+  assert.equal(parsePageSize('2.5'), undefined);
+});
+
+test('parsePageSize should return undefined for zero and negative values', () => {
+  assert.equal(parsePageSize('0'), undefined);
+  assert.equal(parsePageSize('-10'), undefined);
+});
+
+test('parsePageSize should pass through in-range values', () => {
+  assert.equal(parsePageSize('1'), 1);
+  assert.equal(parsePageSize('25'), 25);
+  assert.equal(parsePageSize('100'), 100);
+});
+
+test('parsePageSize should clamp values above the maximum', () => {
+  assert.equal(parsePageSize('101'), 100);
+  assert.equal(parsePageSize('9999'), 100);
+});
+
+test('parsePageSize should respect a custom maximum', () => {
+  assert.equal(parsePageSize('30', 50), 30);
+  assert.equal(parsePageSize('80', 50), 50);
+});